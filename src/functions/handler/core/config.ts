@@ -5,9 +5,9 @@
  * validates the structure, and provides caching for performance.
  */
 
+import { setTimeout } from 'timers/promises';
 import { SSMClient, GetParameterCommand } from '@aws-sdk/client-ssm';
 import { LRUCache } from 'lru-cache';
-import yaml from 'js-yaml';
 import { z } from 'zod';
 import type { Config } from '@shared/types';
 import { setupLogger } from '@shared/utils/logger';
@@ -143,15 +143,181 @@ export class ConfigValidationError extends ConfigError {
   }
 }
 
+/**
+ * Matches values whose first non-whitespace character opens a JSON object.
+ * YAML values are sent straight to the YAML parser instead of first failing JSON.parse.
+ */
+const JSON_OBJECT_PREFIX = /^\s*\{/;
+
+/**
+ * Default config cache TTL in seconds.
+ */
+const DEFAULT_CONFIG_CACHE_TTL_SECONDS = 300;
+
+/**
+ * Resolves the config cache TTL from the CONFIG_CACHE_TTL environment variable.
+ *
+ * @returns TTL in milliseconds; falls back to the default for missing or invalid values
+ */
+function resolveConfigCacheTtl(): number {
+  const ttlSeconds = Number(process.env.CONFIG_CACHE_TTL);
+  // 0 is rejected on purpose: lru-cache treats `ttl: 0` as "never expire"
+  if (!Number.isFinite(ttlSeconds) || ttlSeconds <= 0) {
+    return DEFAULT_CONFIG_CACHE_TTL_SECONDS * 1000;
+  }
+  return ttlSeconds * 1000;
+}
+
 /**
  * LRU cache for configuration objects.
- * Prevents unnecessary SSM API calls for the same parameter.
+ * Prevents unnecessary SSM API calls for the same parameter while bounding
+ * how long a warm container can serve a stale config.
  */
 const configCache = new LRUCache<string, Config>({
   max: 128,
-  ttl: 1000 * 60 * 5, // 5 minutes TTL
+  ttl: resolveConfigCacheTtl(),
 });
 
+/**
+ * Maximum time the first load waits on a pending preload before issuing its own request.
+ */
+const PRELOAD_WAIT_MS = 500;
+
+/**
+ * Preload promises still in flight, keyed by parameter name.
+ */
+const pendingPreloads = new Map<string, Promise<Config>>();
+
+/**
+ * Shared SSM client, created on first use.
+ * Reused across warm invocations to avoid rebuilding the client (credential
+ * and endpoint resolution) on every cache miss.
+ */
+let sharedSsmClient: SSMClient | undefined;
+
+/**
+ * Returns the shared SSM client, creating it lazily.
+ *
+ * @returns Shared SSM client
+ */
+function getSsmClient(): SSMClient {
+  sharedSsmClient ??= new SSMClient({});
+  return sharedSsmClient;
+}
+
+/**
+ * Builds the ConfigError raised for a failed SSM call.
+ */
+type SsmErrorHandler = (parameterName: string, cause: unknown) => ConfigError;
+
+/**
+ * Maps AWS SDK error names to their ConfigError builders.
+ * Error names not listed here are wrapped in a generic ConfigError.
+ */
+const SSM_ERROR_HANDLERS: ReadonlyMap<string, SsmErrorHandler> = new Map([
+  [
+    'ParameterNotFound',
+    (parameterName, cause) =>
+      new ParameterNotFoundError(`Could not find SSM parameter: ${parameterName}`, { cause }),
+  ],
+  [
+    'ThrottlingException',
+    (parameterName, cause) =>
+      new ConfigError(`SSM request throttled for parameter: ${parameterName}: ${String(cause)}`, {
+        cause,
+      }),
+  ],
+  [
+    'AccessDeniedException',
+    (parameterName, cause) =>
+      new ConfigError(`Access denied to SSM parameter: ${parameterName}: ${String(cause)}`, {
+        cause,
+      }),
+  ],
+]);
+
+/**
+ * Converts an error thrown by an SSM call into a ConfigError.
+ * ConfigError instances are returned unchanged.
+ *
+ * @param error - The error thrown by the SSM client
+ * @param parameterName - The requested parameter name, used in error messages
+ * @param fallbackMessage - Message prefix for errors without a dedicated handler
+ * @returns The ConfigError to throw
+ */
+function toConfigError(
+  error: unknown,
+  parameterName: string,
+  fallbackMessage: string
+): ConfigError {
+  // Errors raised by the loader itself are already mapped
+  if (error instanceof ConfigError) {
+    return error;
+  }
+
+  // Type guard for AWS SDK errors
+  const errorName =
+    error && typeof error === 'object' && 'name' in error ? String(error.name) : undefined;
+  const handler = errorName ? SSM_ERROR_HANDLERS.get(errorName) : undefined;
+  if (handler) {
+    return handler(parameterName, error);
+  }
+  return new ConfigError(`${fallbackMessage}: ${String(error)}`, { cause: error });
+}
+
+/**
+ * Parses and validates a raw SSM parameter value.
+ *
+ * @param parameterName - The name of the SSM parameter (used in error messages)
+ * @param parameterValue - The raw parameter value
+ * @returns Validated configuration object
+ *
+ * @throws {ConfigError} If the value cannot be parsed
+ * @throws {ConfigValidationError} If required fields are missing
+ */
+async function parseConfig(parameterName: string, parameterValue: string): Promise<Config> {
+  // Parse JSON first (deploy-config.js publishes the config as JSON), falling back to
+  // YAML for hand-written parameters. js-yaml is only loaded when the fallback is hit,
+  // and CORE_SCHEMA skips the timestamp/merge/binary resolvers of the default schema.
+  // FAILSAFE_SCHEMA would skip scalar resolution entirely, but it returns every value
+  // as a string and resource_defaults/notifications need real numbers and booleans.
+  let config: unknown;
+  let parsedAsJson = false;
+  if (JSON_OBJECT_PREFIX.test(parameterValue)) {
+    try {
+      config = JSON.parse(parameterValue);
+      parsedAsJson = true;
+    } catch {
+      // Not valid JSON (e.g. a YAML flow mapping); fall back to YAML below
+    }
+  }
+
+  if (!parsedAsJson) {
+    try {
+      const yaml = await import('js-yaml');
+      config = yaml.load(parameterValue, { schema: yaml.CORE_SCHEMA });
+    } catch (error) {
+      throw new ConfigError(
+        `Failed to parse YAML configuration from parameter ${parameterName}: ${String(error)}`,
+        { cause: error }
+      );
+    }
+  }
+
+  // Validate schema; safeParse collects every issue in one pass without throwing
+  const result = ConfigSchema.safeParse(config);
+  if (!result.success) {
+    const invalidFields = [...new Set(result.error.errors.map((e) => e.path.join('.')))];
+
+    throw new ConfigValidationError(
+      `Configuration validation failed. Missing or invalid fields: ${invalidFields.join(', ')}`,
+      { cause: result.error }
+    );
+  }
+
+  return result.data;
+}
+
 /**
  * Loads configuration from an AWS SSM parameter.
  *
@@ -174,9 +340,43 @@ export async function loadConfigFromSsm(
     return cached;
   }
 
-  logger.info(`Loading config from SSM: ${parameterName}`);
+  const preloaded = await waitForPreload(parameterName);
+  if (preloaded) {
+    logger.debug(`Using preloaded config for parameter: ${parameterName}`);
+    return preloaded;
+  }
 
-  const ssmClient = client ?? new SSMClient({});
+  return fetchConfig(parameterName, client ?? getSsmClient());
+}
+
+/**
+ * Waits for a pending preload of the parameter, up to PRELOAD_WAIT_MS.
+ *
+ * @param parameterName - The name of the SSM parameter
+ * @returns The preloaded config, or undefined if there is no preload, it failed or it timed out
+ */
+async function waitForPreload(parameterName: string): Promise<Config | undefined> {
+  const pending = pendingPreloads.get(parameterName);
+  if (!pending) {
+    return undefined;
+  }
+
+  // An unref'd timer does not keep the event loop alive once the race is settled
+  return Promise.race([
+    pending.catch(() => undefined),
+    setTimeout(PRELOAD_WAIT_MS, undefined, { ref: false }),
+  ]);
+}
+
+/**
+ * Fetches, validates and caches configuration from an AWS SSM parameter.
+ *
+ * @param parameterName - The name of the SSM parameter
+ * @param ssmClient - SSM client used for the request
+ * @returns Parsed and validated configuration object
+ */
+async function fetchConfig(parameterName: string, ssmClient: SSMClient): Promise<Config> {
+  logger.info(`Loading config from SSM: ${parameterName}`);
 
   // Fetch parameter from SSM
   let parameterValue: string;
@@ -189,52 +389,10 @@ export async function loadConfigFromSsm(
       throw new ConfigError(`SSM parameter ${parameterName} exists but has no value`);
     }
   } catch (error) {
-    // Type guard for AWS SDK errors
-    if (
-      error &&
-      typeof error === 'object' &&
-      'name' in error &&
-      error.name === 'ParameterNotFound'
-    ) {
-      throw new ParameterNotFoundError(`Could not find SSM parameter: ${parameterName}`, {
-        cause: error,
-      });
-    }
-    throw new ConfigError(`Failed to retrieve SSM parameter: ${String(error)}`, {
-      cause: error,
-    });
-  }
-
-  // Parse YAML
-  let config: unknown;
-  try {
-    config = yaml.load(parameterValue);
-  } catch (error) {
-    throw new ConfigError(
-      `Failed to parse YAML configuration from parameter ${parameterName}: ${String(error)}`,
-      { cause: error }
-    );
+    throw toConfigError(error, parameterName, 'Failed to retrieve SSM parameter');
   }
 
-  // Validate schema
-  let validatedConfig: Config;
-  try {
-    validatedConfig = ConfigSchema.parse(config);
-  } catch (error) {
-    if (error instanceof z.ZodError) {
-      const missingFields = error.errors
-        .filter((e) => e.code === 'invalid_type')
-        .map((e) => e.path.join('.'));
-
-      throw new ConfigValidationError(
-        `Configuration validation failed. Missing or invalid fields: ${missingFields.join(', ')}`,
-        { cause: error }
-      );
-    }
-    throw new ConfigValidationError(`Configuration validation failed: ${String(error)}`, {
-      cause: error,
-    });
-  }
+  const validatedConfig = await parseConfig(parameterName, parameterValue);
 
   // Cache the validated config
   configCache.set(parameterName, validatedConfig);
@@ -243,11 +401,40 @@ export async function loadConfigFromSsm(
   return validatedConfig;
 }
 
+/**
+ * Starts loading configuration from an AWS SSM parameter without waiting for it.
+ *
+ * Called at module scope so the SSM request starts during the Lambda init phase.
+ * The first load reuses the pending request for up to PRELOAD_WAIT_MS and then
+ * issues its own, so a preload frozen mid-flight (e.g. under provisioned
+ * concurrency) cannot stall the invocation. Failures are only logged.
+ *
+ * @param parameterName - The name of the SSM parameter
+ */
+export function preloadConfig(parameterName: string): void {
+  const preload = fetchConfig(parameterName, getSsmClient());
+  pendingPreloads.set(parameterName, preload);
+
+  preload
+    .finally(() => {
+      if (pendingPreloads.get(parameterName) === preload) {
+        pendingPreloads.delete(parameterName);
+      }
+    })
+    .catch((error: unknown) => {
+      logger.warn(
+        { parameterName, error: String(error) },
+        'Config preload failed, deferring to first invocation'
+      );
+    });
+}
+
 /**
  * Clears the configuration cache.
  * Useful for testing or forcing a fresh config reload.
  */
 export function clearConfigCache(): void {
   configCache.clear();
+  pendingPreloads.clear();
   logger.debug('Config cache cleared');
 }
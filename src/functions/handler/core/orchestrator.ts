@@ -501,14 +501,17 @@ export class Orchestrator {
       }
     });
 
-    logger.debug(
-      {
-        action,
-        sortOrder: action === 'start' ? 'ascending' : 'descending',
-        priorities: sorted.map((r) => ({ id: r.resourceId, priority: r.priority })),
-      },
-      'Resources sorted by priority'
-    );
+    // Skip building the per-resource priority list when debug logging is off
+    if (logger.isLevelEnabled('debug')) {
+      logger.debug(
+        {
+          action,
+          sortOrder: action === 'start' ? 'ascending' : 'descending',
+          priorities: sorted.map((r) => ({ id: r.resourceId, priority: r.priority })),
+        },
+        'Resources sorted by priority'
+      );
+    }
 
     return sorted;
   }
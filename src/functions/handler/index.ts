@@ -13,7 +13,7 @@ import type {
   TriggerSource,
   LambdaEvent,
 } from '@shared/types';
-import { loadConfigFromSsm } from './core/config';
+import { loadConfigFromSsm, preloadConfig } from './core/config';
 import { Orchestrator } from './core/orchestrator';
 import { setupLogger } from '@shared/utils/logger';
 import { detectTriggerSource } from '@shared/utils/triggerSourceDetector';
@@ -23,6 +23,11 @@ const logger = setupLogger('lights-out:main');
 // Default SSM parameter name (can be overridden via environment variable)
 const DEFAULT_CONFIG_PARAMETER = '/lights-out/config';
 
+// Start loading the config during the Lambda init phase; the first invocation reuses the request
+if (process.env.CONFIG_PARAMETER_NAME) {
+  preloadConfig(process.env.CONFIG_PARAMETER_NAME);
+}
+
 // Valid actions
 const VALID_ACTIONS: ReadonlySet<string> = new Set(['start', 'stop', 'status', 'discover']);
 
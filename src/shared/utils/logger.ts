@@ -2,17 +2,51 @@
  * Structured JSON logger for AWS Lambda.
  *
  * Uses Pino for production-grade JSON logging with CloudWatch compatibility.
+ * Pino writes to fd 1 via SonicBoom when no destination is given.
  */
 
 import pino from 'pino';
 
 type LogLevel = 'debug' | 'info' | 'warn' | 'error';
 
+/**
+ * Logger instances keyed by name and resolved level.
+ * Handlers call setupLogger() per resource, so instances are shared instead
+ * of rebuilding a Pino logger (and its destination) on every call.
+ */
+const loggerCache = new Map<string, pino.Logger>();
+
+let cachedSecond = -1;
+let cachedSecondPrefix = '';
+
+/**
+ * ISO 8601 timestamp function, equivalent to pino.stdTimeFunctions.isoTime.
+ *
+ * The "YYYY-MM-DDTHH:mm:ss." prefix only changes once per second, so it is
+ * cached and only the milliseconds are appended per record. This avoids a
+ * Date allocation and toISOString() call on every log line.
+ *
+ * @returns Pino time fragment, e.g. `,"time":"2026-01-01T00:00:00.000Z"`
+ */
+function isoTime(): string {
+  const now = Date.now();
+  const second = Math.floor(now / 1000);
+
+  if (second !== cachedSecond) {
+    cachedSecond = second;
+    cachedSecondPrefix = new Date(second * 1000).toISOString().slice(0, 20);
+  }
+
+  const millis = String(now - second * 1000).padStart(3, '0');
+  return `,"time":"${cachedSecondPrefix}${millis}Z"`;
+}
+
 /**
  * Create and configure a Pino logger instance.
  *
  * Reads LOG_LEVEL from environment variable (supports both lowercase and uppercase).
- * Defaults to 'info' if not specified.
+ * Defaults to 'info' if not specified. Repeated calls with the same name and
+ * resolved level return the same instance.
  *
  * @param name - Logger name
  * @param level - Optional log level override
@@ -23,12 +57,24 @@ export function setupLogger(name: string = 'lights-out', level?: string): pino.L
     process.env.LOG_LEVEL?.toLowerCase() ||
     'info') as LogLevel;
 
-  return pino({
+  const cacheKey = `${name}:${logLevel}`;
+  const cached = loggerCache.get(cacheKey);
+  if (cached) {
+    return cached;
+  }
+
+  const logger = pino({
     name,
     level: logLevel,
+    // Omit the default pid/hostname bindings; they carry no information in Lambda
+    base: {},
+    // Pino serializes the level and name fragments once per instance, not per record
     formatters: {
       level: (label) => ({ level: label.toUpperCase() }),
     },
-    timestamp: pino.stdTimeFunctions.isoTime,
+    timestamp: isoTime,
   });
+
+  loggerCache.set(cacheKey, logger);
+  return logger;
 }
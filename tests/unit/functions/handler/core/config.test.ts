@@ -1,8 +1,10 @@
-import { describe, it, expect, beforeEach } from 'vitest';
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { performance } from 'perf_hooks';
 import { mockClient } from 'aws-sdk-client-mock';
 import { SSMClient, GetParameterCommand } from '@aws-sdk/client-ssm';
 import {
   loadConfigFromSsm,
+  preloadConfig,
   clearConfigCache,
   ConfigError,
   ParameterNotFoundError,
@@ -86,6 +88,30 @@ discovery:
       );
     });
 
+    it('should throw ConfigError when SSM throttles the request', async () => {
+      const throttlingError = new Error('Rate exceeded');
+      throttlingError.name = 'ThrottlingException';
+
+      ssmMock.on(GetParameterCommand).rejects(throttlingError);
+
+      await expect(loadConfigFromSsm('/test/parameter')).rejects.toThrow(ConfigError);
+
+      await expect(loadConfigFromSsm('/test/parameter')).rejects.toThrow(
+        'SSM request throttled for parameter: /test/parameter: ThrottlingException: Rate exceeded'
+      );
+    });
+
+    it('should throw ConfigError when access to the SSM parameter is denied', async () => {
+      const accessDeniedError = new Error('Not authorized');
+      accessDeniedError.name = 'AccessDeniedException';
+
+      ssmMock.on(GetParameterCommand).rejects(accessDeniedError);
+
+      await expect(loadConfigFromSsm('/test/parameter')).rejects.toThrow(
+        'Access denied to SSM parameter: /test/parameter: AccessDeniedException: Not authorized'
+      );
+    });
+
     it('should throw ConfigError when SSM returns empty value', async () => {
       ssmMock.on(GetParameterCommand).resolves({
         Parameter: {
@@ -95,7 +121,9 @@ discovery:
 
       await expect(loadConfigFromSsm('/test/parameter')).rejects.toThrow(ConfigError);
 
-      await expect(loadConfigFromSsm('/test/parameter')).rejects.toThrow('has no value');
+      await expect(loadConfigFromSsm('/test/parameter')).rejects.toThrow(
+        /^SSM parameter \/test\/parameter exists but has no value$/
+      );
     });
 
     it('should throw ConfigError when SSM call fails with generic error', async () => {
@@ -128,6 +156,87 @@ discovery: }invalid
       );
     });
 
+    it('should load and parse JSON configuration from SSM', async () => {
+      const jsonConfig = JSON.stringify({
+        version: '1.0',
+        environment: 'workshop',
+        discovery: { method: 'tag-based', tags: { 'lights-out:managed': 'true' } },
+      });
+
+      ssmMock.on(GetParameterCommand).resolves({
+        Parameter: {
+          Value: jsonConfig,
+        },
+      });
+
+      const config = await loadConfigFromSsm('/test/parameter');
+
+      expect(config.version).toBe('1.0');
+      expect(config.environment).toBe('workshop');
+      expect(config.discovery).toEqual({
+        method: 'tag-based',
+        tags: {
+          'lights-out:managed': 'true',
+        },
+      });
+    });
+
+    it('should fall back to YAML for a flow mapping that is not valid JSON', async () => {
+      const flowMappingConfig = '{environment: workshop, discovery: {method: tag-based}}';
+      const jsonParseSpy = vi.spyOn(JSON, 'parse');
+
+      ssmMock.on(GetParameterCommand).resolves({
+        Parameter: {
+          Value: flowMappingConfig,
+        },
+      });
+
+      const config = await loadConfigFromSsm('/test/parameter');
+
+      expect(jsonParseSpy).toHaveBeenCalledWith(flowMappingConfig);
+      expect(config.environment).toBe('workshop');
+      expect(config.discovery).toEqual({ method: 'tag-based' });
+    });
+
+    it('should skip JSON.parse for block YAML values', async () => {
+      const blockYamlConfig = `
+environment: workshop
+discovery:
+  method: tag-based
+`;
+      const jsonParseSpy = vi.spyOn(JSON, 'parse');
+
+      ssmMock.on(GetParameterCommand).resolves({
+        Parameter: {
+          Value: blockYamlConfig,
+        },
+      });
+
+      const config = await loadConfigFromSsm('/test/parameter');
+
+      expect(jsonParseSpy).not.toHaveBeenCalledWith(blockYamlConfig);
+      expect(config.environment).toBe('workshop');
+    });
+
+    it('should keep date-like scalars as strings', async () => {
+      const configWithDate = `
+environment: workshop
+discovery:
+  method: tag-based
+holidays:
+  - 2026-01-01
+`;
+
+      ssmMock.on(GetParameterCommand).resolves({
+        Parameter: {
+          Value: configWithDate,
+        },
+      });
+
+      const config = await loadConfigFromSsm('/test/parameter');
+      expect(config.holidays).toEqual(['2026-01-01']);
+    });
+
     it("should accept config without 'version' field (version is optional)", async () => {
       const configWithoutVersion = `
 environment: workshop
@@ -177,6 +286,19 @@ environment: workshop
       await expect(loadConfigFromSsm('/test/parameter')).rejects.toThrow(ConfigValidationError);
     });
 
+    it('should report all missing required fields in one error', async () => {
+      ssmMock.on(GetParameterCommand).resolves({
+        Parameter: {
+          Value: 'version: "1.0"',
+        },
+      });
+
+      const config = loadConfigFromSsm('/test/parameter');
+
+      await expect(config).rejects.toThrow(ConfigValidationError);
+      await expect(config).rejects.toThrow('Missing or invalid fields: environment, discovery');
+    });
+
     it('should accept configuration with optional fields', async () => {
       const configWithOptionals = `
 version: "1.0"
@@ -249,6 +371,111 @@ discovery:
     });
   });
 
+  describe('preloadConfig', () => {
+    const validConfig = `
+environment: workshop
+discovery:
+  method: tag-based
+`;
+
+    it('should reuse the pending preload for the first load', async () => {
+      ssmMock.on(GetParameterCommand).resolves({ Parameter: { Value: validConfig } });
+
+      preloadConfig('/test/parameter');
+      const config = await loadConfigFromSsm('/test/parameter');
+
+      expect(config.environment).toBe('workshop');
+      expect(ssmMock.calls()).toHaveLength(1);
+    });
+
+    it('should issue its own request when the preload does not finish in time', async () => {
+      ssmMock
+        .on(GetParameterCommand)
+        .callsFakeOnce(() => new Promise(() => {}))
+        .resolves({ Parameter: { Value: validConfig } });
+
+      preloadConfig('/test/parameter');
+      const config = await loadConfigFromSsm('/test/parameter');
+
+      expect(config.environment).toBe('workshop');
+      expect(ssmMock.calls()).toHaveLength(2);
+    });
+
+    it('should not throw when the preload fails and retry on the next load', async () => {
+      ssmMock
+        .on(GetParameterCommand)
+        .rejectsOnce(new Error('Network timeout'))
+        .resolves({ Parameter: { Value: validConfig } });
+
+      expect(() => preloadConfig('/test/parameter')).not.toThrow();
+      // Let the rejected preload settle
+      await new Promise((resolve) => setTimeout(resolve, 0));
+      expect(ssmMock.calls()).toHaveLength(1);
+
+      const config = await loadConfigFromSsm('/test/parameter');
+
+      expect(config.environment).toBe('workshop');
+      expect(ssmMock.calls()).toHaveLength(2);
+    });
+  });
+
+  describe('Config cache TTL', () => {
+    const validConfig = JSON.stringify({
+      environment: 'workshop',
+      discovery: { method: 'tag-based' },
+    });
+
+    // lru-cache reads the clock through performance.now() and debounces it for 1ms
+    let now = 0;
+    const advanceClock = async (ms: number) => {
+      now += ms;
+      await new Promise((resolve) => setTimeout(resolve, 5));
+    };
+
+    /**
+     * Re-imports the config module with CONFIG_CACHE_TTL set and checks that a
+     * cached config is reloaded from SSM only once ttlMs has passed.
+     */
+    const expectReloadAfter = async (value: string, ttlMs: number) => {
+      vi.stubEnv('CONFIG_CACHE_TTL', value);
+      vi.resetModules();
+      const config = await import('@functions/handler/core/config');
+      const client = new SSMClient({});
+
+      await config.loadConfigFromSsm('/test/parameter', client);
+      await advanceClock(ttlMs - 1_000);
+      await config.loadConfigFromSsm('/test/parameter', client);
+      expect(ssmMock.calls()).toHaveLength(1);
+
+      await advanceClock(2_000);
+      await config.loadConfigFromSsm('/test/parameter', client);
+      expect(ssmMock.calls()).toHaveLength(2);
+    };
+
+    beforeEach(() => {
+      now = 1_000;
+      vi.spyOn(performance, 'now').mockImplementation(() => now);
+      ssmMock.on(GetParameterCommand).resolves({ Parameter: { Value: validConfig } });
+    });
+
+    afterEach(() => {
+      vi.unstubAllEnvs();
+      vi.resetModules();
+    });
+
+    it('should expire cached configs after CONFIG_CACHE_TTL seconds', async () => {
+      await expectReloadAfter('60', 60_000);
+    });
+
+    it('should fall back to 300 seconds for a non-numeric CONFIG_CACHE_TTL', async () => {
+      await expectReloadAfter('five minutes', 300_000);
+    });
+
+    it('should fall back to 300 seconds when CONFIG_CACHE_TTL is 0', async () => {
+      await expectReloadAfter('0', 300_000);
+    });
+  });
+
   describe('clearConfigCache', () => {
     it('should clear the cache and force reload from SSM', async () => {
       const config = `
@@ -51,13 +51,18 @@ vi.mock('@functions/handler/handlers/factory', () => ({
   getHandler: mockGetHandlerFn,
 }));
 
-vi.mock('@shared/utils/logger', () => ({
-  setupLogger: () => ({
+const { mockLogger } = vi.hoisted(() => ({
+  mockLogger: {
     info: vi.fn(),
     warn: vi.fn(),
     error: vi.fn(),
     debug: vi.fn(),
-  }),
+    isLevelEnabled: vi.fn(() => true),
+  },
+}));
+
+vi.mock('@shared/utils/logger', () => ({
+  setupLogger: () => mockLogger,
 }));
 
 vi.mock('@shared/utils/teamsNotifier', () => ({
@@ -799,6 +804,52 @@ describe('Orchestrator', () => {
       expect(executionOrder[0]).toBe('c3/s3');
       expect(executionOrder.slice(1)).toEqual(expect.arrayContaining(['c1/s1', 'c2/s2']));
     });
+
+    describe('debug logging', () => {
+      const resource: DiscoveredResource = {
+        resourceType: 'ecs-service',
+        arn: 'arn:aws:ecs:us-east-1:123456:service/c1/s1',
+        resourceId: 'c1/s1',
+        priority: 10,
+        group: 'default',
+        tags: {},
+        metadata: { cluster_name: 'c1' },
+      };
+
+      beforeEach(() => {
+        mockDiscoverFn.mockResolvedValue([resource]);
+        mockGetHandlerFn.mockReturnValue({
+          start: vi.fn().mockResolvedValue({
+            success: true,
+            action: 'start',
+            resourceType: 'ecs-service',
+            resourceId: 'c1/s1',
+            message: 'Started',
+          } as HandlerResult),
+        } as unknown as ResourceHandler);
+      });
+
+      it('should log the sorted priorities when debug logging is enabled', async () => {
+        await orchestrator.run('start');
+
+        expect(mockLogger.debug).toHaveBeenCalledWith(
+          expect.objectContaining({ priorities: [{ id: 'c1/s1', priority: 10 }] }),
+          'Resources sorted by priority'
+        );
+      });
+
+      it('should skip the sorted priorities log when debug logging is disabled', async () => {
+        mockLogger.isLevelEnabled.mockReturnValueOnce(false);
+
+        await orchestrator.run('start');
+
+        expect(mockLogger.isLevelEnabled).toHaveBeenCalledWith('debug');
+        expect(mockLogger.debug).not.toHaveBeenCalledWith(
+          expect.anything(),
+          'Resources sorted by priority'
+        );
+      });
+    });
   });
 
   describe('execution strategies', () => {
@@ -5,7 +5,7 @@
  * Uses Vitest hoisted mocks for proper module mocking.
  */
 
-import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
 import type { Context } from 'aws-lambda';
 import type { Config, DiscoveredResource, OrchestrationResult } from '@shared/types';
 
@@ -60,9 +60,14 @@ const { mockLoadConfigFromSsm, mockOrchestratorClass, mockDiscoverResourcesFn, m
     };
   });
 
+const { mockPreloadConfig } = vi.hoisted(() => ({
+  mockPreloadConfig: vi.fn(),
+}));
+
 // Mock the modules using hoisted factories
 vi.mock('@functions/handler/core/config', () => ({
   loadConfigFromSsm: mockLoadConfigFromSsm,
+  preloadConfig: mockPreloadConfig,
 }));
 
 vi.mock('@functions/handler/core/orchestrator', () => ({
@@ -492,6 +497,32 @@ describe('Lambda Handler (main)', () => {
     });
   });
 
+  describe('config preload', () => {
+    afterEach(() => {
+      vi.unstubAllEnvs();
+    });
+
+    it('should preload the config at import when CONFIG_PARAMETER_NAME is set', async () => {
+      vi.stubEnv('CONFIG_PARAMETER_NAME', '/preload/lights-out/config');
+      mockPreloadConfig.mockClear();
+
+      vi.resetModules();
+      await import('@functions/handler/index');
+
+      expect(mockPreloadConfig).toHaveBeenCalledWith('/preload/lights-out/config');
+    });
+
+    it('should skip the preload when CONFIG_PARAMETER_NAME is not set', async () => {
+      vi.stubEnv('CONFIG_PARAMETER_NAME', undefined);
+      mockPreloadConfig.mockClear();
+
+      vi.resetModules();
+      await import('@functions/handler/index');
+
+      expect(mockPreloadConfig).not.toHaveBeenCalled();
+    });
+  });
+
   describe('environment variable', () => {
     it('should use custom SSM parameter from environment variable', async () => {
       const originalEnv = process.env.CONFIG_PARAMETER_NAME;
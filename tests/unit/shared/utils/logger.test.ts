@@ -71,6 +71,33 @@ describe('Logger Configuration', () => {
     expect(logger.level).toBe('info');
   });
 
+  it('should not include pid or hostname in log output', () => {
+    const logger = setupLogger('base-test', 'info');
+    logger.info('test message');
+
+    expect(capturedLogs).toHaveLength(1);
+    const logEntry = JSON.parse(capturedLogs[0].trim());
+    expect(logEntry.name).toBe('base-test');
+    expect(logEntry).not.toHaveProperty('pid');
+    expect(logEntry).not.toHaveProperty('hostname');
+  });
+
+  it('should reuse the logger instance for the same name and level', () => {
+    const first = setupLogger('cached-test', 'info');
+    const second = setupLogger('cached-test', 'INFO');
+
+    expect(second).toBe(first);
+  });
+
+  it('should create separate logger instances for different levels', () => {
+    const infoLogger = setupLogger('cached-level-test', 'info');
+    const debugLogger = setupLogger('cached-level-test', 'debug');
+
+    expect(debugLogger).not.toBe(infoLogger);
+    expect(infoLogger.level).toBe('info');
+    expect(debugLogger.level).toBe('debug');
+  });
+
   it('should output uppercase level names in log output', () => {
     const logger = setupLogger('level-test', 'info');
     logger.info('test message');
@@ -80,6 +107,24 @@ describe('Logger Configuration', () => {
     expect(logEntry.level).toBe('INFO');
   });
 
+  it('should output ISO 8601 timestamps in log output', () => {
+    const logger = setupLogger('time-test', 'info');
+    const before = Date.now();
+    logger.info('first message');
+    logger.info('second message');
+    const after = Date.now();
+
+    expect(capturedLogs).toHaveLength(2);
+    for (const line of capturedLogs) {
+      const logEntry = JSON.parse(line.trim());
+      expect(logEntry.time).toMatch(/^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z$/);
+
+      const time = Date.parse(logEntry.time);
+      expect(time).toBeGreaterThanOrEqual(before);
+      expect(time).toBeLessThanOrEqual(after);
+    }
+  });
+
   it('should log at the configured level and suppress lower levels', () => {
     delete process.env.LOG_LEVEL;
     const logger = setupLogger('filter-test');